@@ -17,8 +17,9 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
+from random import random
+
 from OCCT.Quantity import Quantity_TOC_RGB, Quantity_Color
-from numpy.random import rand
 
 __all__ = ["Metadata", "NamedItem", "ViewableItem"]
 
@@ -156,5 +157,5 @@ class ViewableItem(object):
 
         :return: None.
         """
-        r, g, b = rand(1, 3)[0]
+        r, g, b = random(), random(), random()
         self._color = Quantity_Color(r, g, b, Quantity_TOC_RGB)
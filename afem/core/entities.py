@@ -671,7 +671,7 @@ class ShapeHolder(NamedItem, ViewableItem):
         p3.translate(vn)
         return PlaneByPoints(p1, p2, p3).plane
 
-    def extract_curve(self, u1, v1, u2, v2, basis_shape=None):
+    def extract_curve(self, u1, v1, u2, v2, basis_shape=None, section=None):
         """
         Extract a trimmed curve within the reference surface between the
         parameters.
@@ -688,6 +688,10 @@ class ShapeHolder(NamedItem, ViewableItem):
             the intersection which could yield unanticipated results.
         :type basis_shape: afem.geometry.entities.Surface or
             afem.topology.entities.Shape
+        :param section: The intersection between the basis shape and the
+            reference shape if it has already been computed. If provided, it
+            is used instead of intersecting the shapes again.
+        :type section: afem.topology.entities.Shape or None
 
         :return: The curve.
         :rtype: afem.geometry.entities.TrimmedCurve
@@ -697,14 +701,14 @@ class ShapeHolder(NamedItem, ViewableItem):
         p1 = self.sref.eval(u1, v1)
         p2 = self.sref.eval(u2, v2)
 
-        if basis_shape is None:
-            basis_shape = self.extract_plane(u1, v1, u2, v2)
-        basis_shape = Shape.to_shape(basis_shape)
+        if section is None:
+            if basis_shape is None:
+                basis_shape = self.extract_plane(u1, v1, u2, v2)
+            basis_shape = Shape.to_shape(basis_shape)
+            section = IntersectShapes(basis_shape, self.sref_shape,
+                                      approximate=True).shape
 
-        bop = IntersectShapes(basis_shape, self.sref_shape, approximate=True)
-        shape = bop.shape
-
-        edges = shape.edges
+        edges = section.edges
         builder = WiresByConnectedEdges(edges)
         if builder.nwires == 0:
             msg = 'Failed to extract any curves.'
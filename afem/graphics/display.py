@@ -75,7 +75,7 @@ class Viewer(ViewerWx):
 
         :return: None.
         """
-        for part in group.get_parts(include_subgroup):
+        for part in group.iter_parts(include_subgroup):
             self.display_item(part)
 
     def add(self, *items):
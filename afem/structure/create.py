@@ -94,6 +94,25 @@ _type_to_part = {
 }
 
 
+def _common_with_body(basis_shape, body):
+    """
+    Find the common shape between the basis shape and the body.
+
+    :param afem.topology.entities.Shape basis_shape: The basis shape.
+    :param afem.oml.entities.Body body: The body.
+
+    :return: The common shape.
+    :rtype: afem.topology.entities.Shape
+
+    :raise RuntimeError: If Boolean operation fails.
+    """
+    common = CommonShapes(basis_shape, body.shape)
+    if not common.is_done:
+        msg = 'Boolean operation failed.'
+        raise RuntimeError(msg)
+    return common.shape
+
+
 # PART ------------------------------------------------------------------------
 class CreatePartByName(object):
     """
@@ -302,7 +321,10 @@ class SurfacePartByShape(PartBuilder):
                                   approximate=True)
         edges = section.shape.edges
         wires = WiresByConnectedEdges(edges).wires
-        w = LengthOfShapes(wires).longest_shape
+        if len(wires) > 1:
+            w = LengthOfShapes(wires).longest_shape
+        else:
+            w = wires[0]
         cref = None
         if isinstance(w, (Edge, Wire)):
             cref = w.curve
@@ -311,17 +333,11 @@ class SurfacePartByShape(PartBuilder):
             p0 = body.sref.eval(umin, vmin)
             p1 = cref.eval(cref.u1)
             p2 = cref.eval(cref.u2)
-            d1 = p0.distance(p1)
-            d2 = p0.distance(p2)
-            if d2 < d1:
+            if p0.SquareDistance(p2) < p0.SquareDistance(p1):
                 cref.reverse()
 
         # Build part shape
-        common = CommonShapes(basis_shape, body.shape)
-        if not common.is_done:
-            msg = 'Boolean operation failed.'
-            raise RuntimeError(msg)
-        shape = common.shape
+        shape = _common_with_body(basis_shape, body)
 
         # Get reference surface
         sref = shape.surface
@@ -351,6 +367,9 @@ class SurfacePartByParameters(PartBuilder):
     :type group: str or afem.structure.group.Group or None
     :param Type[afem.structure.entities.Part] type_: The type of part to
         create.
+    :param section: The intersection between the basis shape and the body
+        reference shape if it has already been computed.
+    :type section: afem.topology.entities.Shape or None
 
     :raise RuntimeError: If Boolean operation fails.
 
@@ -362,7 +381,7 @@ class SurfacePartByParameters(PartBuilder):
     """
 
     def __init__(self, name, u1, v1, u2, v2, body, basis_shape=None,
-                 group=None, type_=SurfacePart):
+                 group=None, type_=SurfacePart, section=None):
 
         # Determine reference surface and basis shape
         if basis_shape is None:
@@ -376,14 +395,10 @@ class SurfacePartByParameters(PartBuilder):
             sref = basis_shape.surface
 
         # Extract cref
-        cref = body.extract_curve(u1, v1, u2, v2, basis_shape)
+        cref = body.extract_curve(u1, v1, u2, v2, basis_shape, section)
 
         # Build part shape
-        common = CommonShapes(basis_shape, body.shape)
-        if not common.is_done:
-            msg = 'Boolean operation failed.'
-            raise RuntimeError(msg)
-        shape = common.shape
+        shape = _common_with_body(basis_shape, body)
 
         super(SurfacePartByParameters, self).__init__(name, shape, cref, sref,
                                                       group, type_)
@@ -408,6 +423,9 @@ class SurfacePartByPoints(SurfacePartByParameters):
     :type group: str or afem.structure.group.Group or None
     :param Type[afem.structure.entities.Part] type_: The type of part to
         create.
+    :param section: The intersection between the basis shape and the body
+        reference shape if it has already been computed.
+    :type section: afem.topology.entities.Shape or None
 
     .. note::
 
@@ -420,7 +438,7 @@ class SurfacePartByPoints(SurfacePartByParameters):
     """
 
     def __init__(self, name, p1, p2, body, basis_shape=None, group=None,
-                 type_=SurfacePart):
+                 type_=SurfacePart, section=None):
         p1 = CheckGeom.to_point(p1)
         p2 = CheckGeom.to_point(p2)
 
@@ -430,7 +448,8 @@ class SurfacePartByPoints(SurfacePartByParameters):
 
         # Use SparByParameters
         super(SurfacePartByPoints, self).__init__(name, u1, v1, u2, v2, body,
-                                                  basis_shape, group, type_)
+                                                  basis_shape, group, type_,
+                                                  section)
 
 
 class SurfacePartByEnds(SurfacePartByParameters):
@@ -510,9 +529,13 @@ class SurfacePartBetweenShapes(SurfacePartByPoints):
         shape1 = shape_of_entity(shape1)
         shape2 = shape_of_entity(shape2)
 
-        wing_basis_edges = IntersectShapes(basis_shape, body.sref_shape).shape
-        p1_shape = IntersectShapes(shape1, wing_basis_edges).shape
-        p2_shape = IntersectShapes(shape2, wing_basis_edges).shape
+        # This section is also used to extract the reference curve
+        section = IntersectShapes(basis_shape, body.sref_shape,
+                                  approximate=True).shape
+        p1_shape = IntersectShapes(shape1, section,
+                                   nondestructive=True).shape
+        p2_shape = IntersectShapes(shape2, section,
+                                   nondestructive=True).shape
         v1 = p1_shape.vertices[0]
         v2 = p2_shape.vertices[0]
         p1 = v1.point
@@ -520,7 +543,7 @@ class SurfacePartBetweenShapes(SurfacePartByPoints):
 
         super(SurfacePartBetweenShapes, self).__init__(name, p1, p2, body,
                                                        basis_shape, group,
-                                                       type_)
+                                                       type_, section)
 
 
 class SurfacePartsBetweenPlanesByNumber(PartsBuilder):
@@ -564,10 +587,13 @@ class SurfacePartsBetweenPlanesByNumber(PartsBuilder):
 
         builder = PlanesBetweenPlanesByNumber(pln1, pln2, n, d1, d2)
 
+        shape1 = shape_of_entity(shape1)
+        shape2 = shape_of_entity(shape2)
+
         self._ds = builder.spacing
         for pln in builder.planes:
             basis_shape = FaceBySurface(pln).face
-            label_indx = delimiter.join([name, str(first_index)])
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
             part = SurfacePartBetweenShapes(label_indx, shape1, shape2, body,
                                             basis_shape, group, type_).part
             first_index += 1
@@ -617,10 +643,13 @@ class SurfacePartsBetweenPlanesByDistance(PartsBuilder):
 
         builder = PlanesBetweenPlanesByDistance(pln1, pln2, maxd, d1, d2, nmin)
 
+        shape1 = shape_of_entity(shape1)
+        shape2 = shape_of_entity(shape2)
+
         self._ds = builder.spacing
         for pln in builder.planes:
             basis_shape = FaceBySurface(pln).face
-            label_indx = delimiter.join([name, str(first_index)])
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
             part = SurfacePartBetweenShapes(label_indx, shape1, shape2, body,
                                             basis_shape, group, type_).part
             first_index += 1
@@ -676,10 +705,13 @@ class SurfacePartsAlongCurveByNumber(PartsBuilder):
         builder = PlanesAlongCurveByNumber(crv, n, ref_pln, u1, u2, d1, d2,
                                            tol)
 
+        shape1 = shape_of_entity(shape1)
+        shape2 = shape_of_entity(shape2)
+
         self._ds = builder.spacing
         for pln in builder.planes:
             basis_shape = FaceBySurface(pln).face
-            label_indx = delimiter.join([name, str(first_index)])
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
             part = SurfacePartBetweenShapes(label_indx, shape1, shape2, body,
                                             basis_shape, group, type_).part
             first_index += 1
@@ -736,10 +768,13 @@ class SurfacePartsAlongCurveByDistance(PartsBuilder):
         builder = PlanesAlongCurveByDistance(crv, maxd, ref_pln, u1, u2, d1,
                                              d2, nmin, tol)
 
+        shape1 = shape_of_entity(shape1)
+        shape2 = shape_of_entity(shape2)
+
         self._ds = builder.spacing
         for pln in builder.planes:
             basis_shape = FaceBySurface(pln).face
-            label_indx = delimiter.join([name, str(first_index)])
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
             part = SurfacePartBetweenShapes(label_indx, shape1, shape2, body,
                                             basis_shape, group, type_).part
             first_index += 1
@@ -1456,10 +1491,13 @@ class RibsAlongCurveAndSurfaceByDistance(PartsBuilder):
         if rot_y is not None:
             builder.rotate_y(rot_y)
 
+        shape1 = shape_of_entity(shape1)
+        shape2 = shape_of_entity(shape2)
+
         self._ds = builder.spacing
         for pln in builder.planes:
             basis_shape = FaceBySurface(pln).face
-            label_indx = delimiter.join([name, str(first_index)])
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
             part = RibBetweenShapes(label_indx, shape1, shape2, body,
                                     basis_shape, group).part
             first_index += 1
@@ -1495,11 +1533,7 @@ class BulkheadByShape(PartBuilder):
             sref = basis_shape.surface
 
         # Build part shape
-        common = CommonShapes(basis_shape, body.shape)
-        if not common.is_done:
-            msg = 'Boolean operation failed.'
-            raise RuntimeError(msg)
-        shape = common.shape
+        shape = _common_with_body(basis_shape, body)
 
         super(BulkheadByShape, self).__init__(name, shape, None, sref, group,
                                               Bulkhead)
@@ -1533,11 +1567,7 @@ class FloorByShape(PartBuilder):
             sref = basis_shape.surface
 
         # Build part shape
-        common = CommonShapes(basis_shape, body.shape)
-        if not common.is_done:
-            msg = 'Boolean operation failed.'
-            raise RuntimeError(msg)
-        shape = common.shape
+        shape = _common_with_body(basis_shape, body)
 
         super(FloorByShape, self).__init__(name, shape, None, sref, group,
                                            Floor)
@@ -1557,19 +1587,28 @@ class FrameByPlane(PartBuilder):
     :param group: The group to add the part to. If not provided the part will
         be added to the active group.
     :type group: str or afem.structure.group.Group or None
+    :param bbox: The bounding box of the body. If not provided it will be
+        computed. Builders creating many frames compute it once and pass it
+        here.
+    :type bbox: afem.topology.entities.BBox or None
+
+    :raise TypeError: If *pln* is not a plane.
+    :raise RuntimeError: If the plane does not intersect the bounding box of
+        the body or if Boolean operation failed.
+    """
+
+    def __init__(self, name, pln, body, height, group=None, bbox=None):
+        # Reject planes that miss the body before the Boolean operation
+        if bbox is None:
+            bbox = body.bbox()
+        if bbox.is_pln_out(pln):
+            msg = 'Plane does not intersect the body.'
+            raise RuntimeError(msg)
 
-    :raise RuntimeError: If Boolean operation failed.
-    """
-
-    def __init__(self, name, pln, body, height, group=None):
         basis_shape = FaceBySurface(pln).face
 
         # Find initial shape
-        common = CommonShapes(basis_shape, body.shape)
-        if not common.is_done:
-            msg = 'Boolean operation failed.'
-            raise RuntimeError(msg)
-        shape = common.shape
+        shape = _common_with_body(basis_shape, body)
 
         # Get outer (free) edge of shape which should be a closed wire. Use
         #  the longest wire if necessary.
@@ -1620,9 +1659,11 @@ class FramesByPlanes(PartsBuilder):
 
         first_index = int(first_index)
 
+        bbox = body.bbox()
         for pln in plns:
-            label_indx = delimiter.join([name, str(first_index)])
-            frame = FrameByPlane(label_indx, pln, body, height, group).part
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
+            frame = FrameByPlane(label_indx, pln, body, height, group,
+                                 bbox).part
             first_index += 1
             self._parts.append(frame)
         self._next_index = first_index
@@ -1662,9 +1703,11 @@ class FramesBetweenPlanesByNumber(PartsBuilder):
         builder = PlanesBetweenPlanesByNumber(pln1, pln2, n, d1, d2)
 
         self._ds = builder.spacing
+        bbox = body.bbox()
         for pln in builder.planes:
-            label_indx = delimiter.join([name, str(first_index)])
-            frame = FrameByPlane(label_indx, pln, body, height, group).part
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
+            frame = FrameByPlane(label_indx, pln, body, height, group,
+                                 bbox).part
             first_index += 1
             self._parts.append(frame)
         self._next_index = first_index
@@ -1705,9 +1748,11 @@ class FramesBetweenPlanesByDistance(PartsBuilder):
         builder = PlanesBetweenPlanesByDistance(pln1, pln2, maxd, d1, d2, nmin)
 
         self._ds = builder.spacing
+        bbox = body.bbox()
         for pln in builder.planes:
-            label_indx = delimiter.join([name, str(first_index)])
-            frame = FrameByPlane(label_indx, pln, body, height, group).part
+            label_indx = '{}{}{}'.format(name, delimiter, first_index)
+            frame = FrameByPlane(label_indx, pln, body, height, group,
+                                 bbox).part
             first_index += 1
             self._parts.append(frame)
         self._next_index = first_index
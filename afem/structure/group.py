@@ -94,6 +94,34 @@ class Group(NamedItem):
         raise KeyError('Part with given name could not be found in the '
                        'group.')
 
+    def iter_parts(self, include_subgroup=True, rtype=None):
+        """
+        Iterate over the parts of the group and its subgroups without
+        building intermediate lists.
+
+        :param bool include_subgroup: Option to recursively include parts
+            from any subgroups.
+        :param rtype: Option to return only parts of a certain type. Provide a
+            class to check if the part is of the given type using
+            *isinstance()*.
+
+        :return: Yield the parts.
+        :rtype: collections.Iterable(afem.structure.entities.Part)
+
+        .. note::
+
+            Parts must not be added to or removed from the groups while
+            iterating. Use :meth:`get_parts` to modify the groups in a loop.
+        """
+        for part in self._parts:
+            if rtype is None or isinstance(part, rtype):
+                yield part
+
+        if include_subgroup:
+            for group in self._children:
+                for part in group.iter_parts(True, rtype):
+                    yield part
+
     def get_parts(self, include_subgroup=True, rtype=None, order=False):
         """
         Get all the parts from the group and its subgroups.
@@ -108,17 +136,7 @@ class Group(NamedItem):
         :return: List of parts.
         :rtype: list(afem.structure.entities.Part)
         """
-        parts = []
-        for part in self.parts:
-            if rtype is None:
-                parts.append(part)
-            else:
-                if isinstance(part, rtype):
-                    parts.append(part)
-
-        if include_subgroup:
-            for group in self._children:
-                parts += group.get_parts(True, rtype)
+        parts = list(self.iter_parts(include_subgroup, rtype))
 
         if not order:
             return parts
@@ -1355,7 +1355,7 @@ class BBox(Bnd_Box):
             msg = 'Methods requires a Plane instance.'
             raise TypeError(msg)
 
-        return self.IsOut(pln.object)
+        return self.IsOut(pln.gp_pln)
 
     def is_box_out(self, bbox):
         """
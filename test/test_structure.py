@@ -18,6 +18,7 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 import unittest
+from unittest import mock
 
 from afem.exchange import brep
 from afem.geometry import *
@@ -117,6 +118,16 @@ class TestStructureEntities(unittest.TestCase):
             self.assertIsInstance(f, Face)
         self.assertIsInstance(self.fspar.face_compound, Compound)
 
+    def test_group_iter_parts(self):
+        group = GroupAPI.get_active()
+        parts = set(group.iter_parts())
+        self.assertEqual(parts, set(group.get_parts()))
+        self.assertIn(self.fspar, parts)
+        ribs = list(group.iter_parts(rtype=Rib))
+        self.assertEqual(len(ribs), len(group.get_parts(rtype=Rib)))
+        for rib in ribs:
+            self.assertIsInstance(rib, Rib)
+
 
 class TestStructureCreate(unittest.TestCase):
     """
@@ -304,6 +315,55 @@ class TestStructureCreate(unittest.TestCase):
         rib = builder.part
         self.assertIsInstance(rib, Rib)
 
+    def test_rib_between_shapes_ends(self):
+        p = self.wing.sref.eval(0.15, 0.5)
+        pln1 = PlaneByAxes(p, 'yz').plane
+        shape1 = FaceBySurface(pln1).face
+        p = self.wing.sref.eval(0.65, 0.5)
+        pln2 = PlaneByAxes(p, 'yz').plane
+        shape2 = FaceBySurface(pln2).face
+        p = self.wing.sref.eval(0.5, 0.5)
+        pln3 = PlaneByAxes(p, 'xz').plane
+        basis_shape = FaceBySurface(pln3).face
+        rib = RibBetweenShapes('rib', shape1, shape2, self.wing,
+                               basis_shape).part
+        p1, p2 = rib.cref.p1, rib.cref.p2
+        self.assertAlmostEqual(pln1.distance(p1), 0., places=3)
+        self.assertAlmostEqual(pln2.distance(p2), 0., places=3)
+        self.assertAlmostEqual(pln3.distance(p1), 0., places=3)
+        self.assertAlmostEqual(pln3.distance(p2), 0., places=3)
+
+    def test_rib_between_shapes_shares_section(self):
+        p = self.wing.sref.eval(0.15, 0.5)
+        pln1 = PlaneByAxes(p, 'yz').plane
+        shape1 = FaceBySurface(pln1).face
+        p = self.wing.sref.eval(0.65, 0.5)
+        pln2 = PlaneByAxes(p, 'yz').plane
+        shape2 = FaceBySurface(pln2).face
+        p = self.wing.sref.eval(0.5, 0.5)
+        pln3 = PlaneByAxes(p, 'xz').plane
+        basis_shape = FaceBySurface(pln3).face
+
+        bops = []
+
+        def intersect(*args, **kwargs):
+            bop = IntersectShapes(*args, **kwargs)
+            bops.append(bop)
+            return bop
+
+        with mock.patch('afem.structure.create.IntersectShapes',
+                        side_effect=intersect), \
+                mock.patch('afem.core.entities.IntersectShapes') as recompute, \
+                mock.patch.object(self.wing, 'extract_curve',
+                                  wraps=self.wing.extract_curve) as extract:
+            RibBetweenShapes('rib', shape1, shape2, self.wing, basis_shape)
+
+        # The section is computed once and handed down to extract_curve
+        self.assertEqual(extract.call_count, 1)
+        section = extract.call_args[0][5]
+        self.assertTrue(section.is_same(bops[0].shape))
+        self.assertEqual(recompute.call_count, 0)
+
     def rib_by_orientation(self):
         p = self.wing.sref.eval(0.15, 0.15)
         builder = RibByOrientation('rib', p, self.wing, gamma=15.)
@@ -409,6 +469,23 @@ class TestStructureCreate(unittest.TestCase):
         frame = builder.part
         self.assertIsInstance(frame, Frame)
 
+    def test_frame_by_plane_outside(self):
+        pln = PlaneByAxes((-1.e5, 0., 0.), 'yz').plane
+        self.assertRaises(RuntimeError, FrameByPlane, 'frame', pln,
+                          self.fuselage, 3.)
+
+    def test_frame_by_plane_bbox(self):
+        pln = PlaneByAxes((600., 0., 0.), 'yz').plane
+        frame1 = FrameByPlane('frame1', pln, self.fuselage, 3.).part
+        bbox = self.fuselage.bbox()
+        frame2 = FrameByPlane('frame2', pln, self.fuselage, 3.,
+                              bbox=bbox).part
+        frame3 = FramesByPlanes('frame3', [pln], self.fuselage, 3.).parts[0]
+        a1 = SurfaceProps(frame1.shape).area
+        self.assertIsInstance(frame2, Frame)
+        self.assertAlmostEqual(SurfaceProps(frame2.shape).area, a1, places=6)
+        self.assertAlmostEqual(SurfaceProps(frame3.shape).area, a1, places=6)
+
     def test_frames_by_planes(self):
         pln1 = PlaneByAxes((600., 0., 0.), 'yz').plane
         pln2 = PlaneByAxes((605., 0., 0.), 'yz').plane